@@ -0,0 +1,62 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import math
+
+# ===============================
+# Function: Monthly EMI
+# ===============================
+def monthly_emi(loan_amount, monthly_rate, months):
+    # (1 + r)^n is computed in log space once and shared by numerator and denominator;
+    # expm1 keeps (1 + r)^n - 1 precise for small monthly rates. Plain math, no NumPy dispatch.
+    exponent = months * math.log1p(monthly_rate)
+    return loan_amount * monthly_rate * math.exp(exponent) / math.expm1(exponent)
+
+# ===============================
+# Function: Loan Clearance Model
+# ===============================
+@st.cache_data(max_entries=128, show_spinner=False)
+def loan_clearance_schedule(property_value, down_payment_pct, interest_rate, tenure_years, rental_roi):
+    down_payment = (down_payment_pct / 100) * property_value
+    loan_amount = property_value - down_payment
+    monthly_interest_rate = (interest_rate / 100) / 12
+    tenure_months = tenure_years * 12
+
+    emi = monthly_emi(loan_amount, monthly_interest_rate, tenure_months)
+    annual_rental_income = (rental_roi / 100) * property_value
+    monthly_rent = annual_rental_income / 12
+
+    # Any rent surplus over the EMI is prepaid every month, so the monthly payment is
+    # constant and the balance follows the amortization closed form
+    effective_payment = emi + max(0.0, monthly_rent - emi)
+    max_months = tenure_months * 2
+    log_growth = math.log1p(monthly_interest_rate)
+
+    def balance_after(months):
+        exponent = months * log_growth
+        return loan_amount * np.exp(exponent) - effective_payment * np.expm1(exponent) / monthly_interest_rate
+
+    if loan_amount <= 0:
+        month = 0
+    elif effective_payment <= loan_amount * monthly_interest_rate:
+        month = max_months
+    else:
+        exact_months = math.log(effective_payment / (effective_payment - monthly_interest_rate * loan_amount)) / log_growth
+        # Tolerance keeps float noise from adding a month when the payoff lands exactly on a month end
+        month = min(math.ceil(exact_months - 1e-9), max_months)
+
+    # Interest = everything paid minus principal repaid (the final month overshoots below zero)
+    total_interest = float(effective_payment * month - loan_amount + balance_after(month))
+
+    # Year-end balances for every completed year, evaluated in one vectorized pass
+    months_arr = np.arange(12, month + 1, 12)
+    balances = np.maximum(balance_after(months_arr), 0.0)
+
+    years_taken = month / 12
+    df_schedule = pd.DataFrame({
+        "Year": months_arr // 12,
+        "Remaining Balance": balances,
+        "Annual Rental Yield": annual_rental_income
+    })
+
+    return loan_amount, round(emi, 2), round(monthly_rent, 2), round(years_taken, 2), annual_rental_income, total_interest, df_schedule
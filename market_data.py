@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+# Streamlit re-executes app.py on every rerun, but this module is imported once per
+# process, so the tables and arrays below are only built at startup.
+
+# ===============================
+# Property Segments Data
+# ===============================
+property_segments = {
+    "Studio / Entry‑level Apartment": {"price_usd": 137500, "roi": 9},
+    "1‑Bedroom Apartment": {"price_usd": 205000, "roi": 7.75},
+    "2‑Bedroom Apartment": {"price_usd": 297500, "roi": 7},
+    "Townhouse / Mid‑segment Villa": {"price_usd": 1020000, "roi": 5},
+    "Premium / Luxury Villa": {"price_usd": 2000000, "roi": 5}
+}
+
+SEGMENT_NAMES = tuple(property_segments.keys())
+SEGMENT_PRICES_USD = np.array([property_segments[seg]["price_usd"] for seg in SEGMENT_NAMES], dtype=float)
+SEGMENT_ROIS = np.array([property_segments[seg]["roi"] for seg in SEGMENT_NAMES], dtype=float)
+
+# ===============================
+# Approximate Annual Property Value Increase
+# ===============================
+property_value_increase = {
+    "Studio / Entry‑level Apartment": 6,
+    "1‑Bedroom Apartment": 8,
+    "2‑Bedroom Apartment": 7,
+    "Townhouse / Mid‑segment Villa": 21,
+    "Premium / Luxury Villa": 25
+}
+
+# ===============================
+# Currency Conversion Rates
+# ===============================
+conversion_rates = {"USD": 1.0, "INR": 88.0, "EUR": 0.86, "GBP": 0.74, "AUD": 1.50}
+
+# ===============================
+# Currency Labels & Symbols
+# ===============================
+currency_map = {"INR (₹)": "INR", "USD ($)": "USD", "GBP (£)": "GBP", "EUR (€)": "EUR", "AUD (A$)": "AUD"}
+currency_symbol_map = {"INR": "₹", "USD": "$", "GBP": "£", "EUR": "€", "AUD": "A$"}
+
+CURRENCY_LABELS = tuple(currency_map.keys())
+
+# ===============================
+# Segment Prices in Every Currency
+# ===============================
+RATE_VEC = np.array(list(conversion_rates.values()), dtype=float)
+segment_price_table = pd.DataFrame(
+    SEGMENT_PRICES_USD[:, None] * RATE_VEC[None, :],
+    index=list(SEGMENT_NAMES),
+    columns=list(conversion_rates.keys())
+)
+# Per-currency price columns as plain arrays, so a rerun only does a dict lookup
+SEGMENT_PRICES_BY_CURRENCY = {currency: segment_price_table[currency].to_numpy() for currency in conversion_rates}